@@ -1,7 +1,16 @@
 """Echo module - ghost that replays recorded player path."""
 
+from array import array
+from collections import deque
+from collections.abc import Sequence
+
 import pygame
 
+try:
+    from sprites import circle_surface
+except ImportError:
+    from src.sprites import circle_surface
+
 
 # Echo color palette - each new echo gets a different color
 ECHO_COLORS = [
@@ -19,68 +28,134 @@ ECHO_COLORS = [
 class Echo:
     """A ghost that replays the player's recorded path."""
 
+    __slots__ = (
+        "path_x", "path_y", "length", "frame_index", "cur_x", "cur_y", "_color", "trail", "finished",
+        "_main_surf", "_glow_surf", "_trail_surfs",
+    )
+
     RADIUS = 12
+    GLOW_RADIUS = RADIUS + 6
     TRAIL_LENGTH = 15
 
-    def __init__(self, path: list[tuple[float, float]], color_index: int):
+    def __init__(self, path: Sequence[tuple[float, float]], color_index: int):
         """Initialize echo with a recorded path.
 
         Args:
-            path: List of (x, y) positions to replay.
+            path: Sequence of (x, y) positions to replay. Coordinates are
+                copied into compact per-axis arrays.
+            color_index: Index into ECHO_COLORS for this echo's color.
+        """
+        path_x = array("d", [p[0] for p in path])
+        path_y = array("d", [p[1] for p in path])
+        self._setup(path_x, path_y, len(path_x), color_index)
+
+    @classmethod
+    def from_history(cls, path_x: array, path_y: array, length: int, color_index: int) -> "Echo":
+        """Create an echo that replays a prefix of shared coordinate arrays.
+
+        The arrays are referenced, not copied. The owner may keep appending
+        to them but must not modify the first `length` entries.
+
+        Args:
+            path_x: Recorded x positions.
+            path_y: Recorded y positions.
+            length: Number of leading frames to replay.
             color_index: Index into ECHO_COLORS for this echo's color.
+
+        Returns:
+            The new echo.
         """
-        self.path = path.copy()
+        echo = cls.__new__(cls)
+        echo._setup(path_x, path_y, length, color_index)
+        return echo
+
+    def _setup(self, path_x: array, path_y: array, length: int, color_index: int) -> None:
+        """Initialize state shared by both constructors."""
+        self.path_x = path_x
+        self.path_y = path_y
+        self.length = length
         self.frame_index = 0
-        self.color = ECHO_COLORS[color_index % len(ECHO_COLORS)]
-        self.trail: list[tuple[float, float]] = []
+        # Current position, refreshed by update() so readers skip the bounds checks
+        self.cur_x = path_x[0] if length else 0
+        self.cur_y = path_y[0] if length else 0
+        self._color = ECHO_COLORS[color_index % len(ECHO_COLORS)]
+        # Trail holds frame indices into path_x / path_y
+        self.trail: deque[int] = deque(maxlen=self.TRAIL_LENGTH)
         self.finished = False
+        self._render_sprites()
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        """Current RGB color."""
+        return self._color
+
+    @color.setter
+    def color(self, value: tuple[int, int, int]) -> None:
+        if value != self._color:
+            self._color = value
+            self._render_sprites()
 
     @property
     def x(self) -> float:
         """Current x position."""
-        if self.frame_index < len(self.path):
-            return self.path[self.frame_index][0]
-        return self.path[-1][0] if self.path else 0
+        return self.cur_x
 
     @property
     def y(self) -> float:
         """Current y position."""
-        if self.frame_index < len(self.path):
-            return self.path[self.frame_index][1]
-        return self.path[-1][1] if self.path else 0
+        return self.cur_y
+
+    def _render_sprites(self) -> None:
+        """Pre-render body, glow and trail fade surfaces for the current color."""
+        color = self._color
+        self._main_surf = circle_surface((*color, 160), self.RADIUS)
+        self._glow_surf = circle_surface((*color, 40), self.GLOW_RADIUS)
+        self._trail_surfs: list[tuple[pygame.Surface, int]] = []
+        for i in range(1, self.TRAIL_LENGTH + 1):
+            radius = max(2, int(self.RADIUS * i / self.TRAIL_LENGTH))
+            alpha = int(150 * i / self.TRAIL_LENGTH) // 4
+            self._trail_surfs.append((circle_surface((*color, alpha), radius), radius))
 
     def update(self) -> None:
         """Advance one frame along the recorded path."""
-        if self.frame_index < len(self.path):
-            pos = self.path[self.frame_index]
-            self.trail.append(pos)
-            if len(self.trail) > self.TRAIL_LENGTH:
-                self.trail.pop(0)
+        if self.frame_index < self.length:
+            self.trail.append(self.frame_index)
             self.frame_index += 1
+            # Hold the last position once the path runs out
+            if self.frame_index < self.length:
+                self.cur_x = self.path_x[self.frame_index]
+                self.cur_y = self.path_y[self.frame_index]
         else:
             self.finished = True
 
+    def draw_items(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Build the blits that draw this echo, back to front.
+
+        Returns:
+            List of (surface, position) pairs for Surface.blits().
+        """
+        # Trail (newest point always gets the largest, brightest sprite)
+        offset = self.TRAIL_LENGTH - len(self.trail)
+        path_x = self.path_x
+        path_y = self.path_y
+        trail_surfs = self._trail_surfs
+        items = []
+        for i, frame in enumerate(self.trail, offset):
+            trail_surface, radius = trail_surfs[i]
+            items.append((trail_surface, (int(path_x[frame]) - radius, int(path_y[frame]) - radius)))
+
+        x = int(self.cur_x)
+        y = int(self.cur_y)
+
+        # Glow, then the echo circle (semi-transparent)
+        items.append((self._glow_surf, (x - self.GLOW_RADIUS, y - self.GLOW_RADIUS)))
+        items.append((self._main_surf, (x - self.RADIUS, y - self.RADIUS)))
+        return items
+
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the echo ghost with trail.
 
         Args:
             screen: Pygame surface to draw on.
         """
-        # Draw trail
-        for i, (tx, ty) in enumerate(self.trail):
-            alpha = int(150 * (i + 1) / len(self.trail)) if self.trail else 150
-            radius = max(2, int(self.RADIUS * (i + 1) / len(self.trail)))
-            trail_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, (*self.color, alpha // 4), (radius, radius), radius)
-            screen.blit(trail_surface, (int(tx) - radius, int(ty) - radius))
-
-        # Draw glow
-        glow_radius = self.RADIUS + 6
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*self.color, 40), (glow_radius, glow_radius), glow_radius)
-        screen.blit(glow_surface, (int(self.x) - glow_radius, int(self.y) - glow_radius))
-
-        # Draw echo circle (semi-transparent)
-        echo_surface = pygame.Surface((self.RADIUS * 2, self.RADIUS * 2), pygame.SRCALPHA)
-        pygame.draw.circle(echo_surface, (*self.color, 160), (self.RADIUS, self.RADIUS), self.RADIUS)
-        screen.blit(echo_surface, (int(self.x) - self.RADIUS, int(self.y) - self.RADIUS))
+        screen.blits(self.draw_items(), doreturn=False)
@@ -2,6 +2,8 @@
 import asyncio
 import pygame
 import math
+import time
+from collections import OrderedDict, deque
 from enum import Enum
 
 try:
@@ -30,6 +32,10 @@ class GameState(Enum):
 WIDTH = 800
 HEIGHT = 600
 FPS = 60
+IDLE_FPS = 10  # poll rate while showing a static screen
+FIXED_DT = 1.0 / FPS  # simulation step; echoes replay one recorded position per step
+MAX_CATCHUP_STEPS = 5  # cap on simulation steps run for one rendered frame
+TEXT_CACHE_SIZE = 128  # rendered text surfaces kept around
 BG_COLOR = (15, 15, 25)
 
 # Game settings
@@ -40,12 +46,28 @@ COLLISION_GRACE = 1.0  # seconds of grace period after echo spawn
 NORMAL_RADIUS = 12
 SHRINK_RADIUS = 6
 
+# Disco mode rainbow: one full color cycle sampled into a lookup table
+DISCO_LUT_SIZE = 1024
+ECHO_DISCO_STEPS = 32  # coarser hue steps for echoes so their sprites stay cached
+_DISCO_LUT = tuple(
+    (
+        int((math.sin(t) * 0.5 + 0.5) * 255),
+        int((math.sin(t + 2.094) * 0.5 + 0.5) * 255),
+        int((math.sin(t + 4.189) * 0.5 + 0.5) * 255),
+    )
+    for t in (2 * math.pi * i / DISCO_LUT_SIZE for i in range(DISCO_LUT_SIZE))
+)
+
+# One bit per powerup type for the active effect mask
+EFFECT_BITS = {ptype: 1 << i for i, ptype in enumerate(PowerupType)}
+
 # Konami code: ↑↑↓↓←→←→BA
 KONAMI_CODE = [
     pygame.K_UP, pygame.K_UP, pygame.K_DOWN, pygame.K_DOWN,
     pygame.K_LEFT, pygame.K_RIGHT, pygame.K_LEFT, pygame.K_RIGHT,
     pygame.K_b, pygame.K_a,
 ]
+_KONAMI_TUPLE = tuple(KONAMI_CODE)
 
 
 class Game:
@@ -58,14 +80,23 @@ class Game:
             screen: Pygame display surface.
         """
         self.screen = screen
-        self.clock = pygame.time.Clock()
+        self._next_frame = 0.0
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 28)
         self.big_font = pygame.font.Font(None, 72)
+        self._title_fonts: dict[int, pygame.font.Font] = {}
+        self._text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        # Static full-screen overlays, filled once and reused every frame
+        self._dim_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._dim_overlay.fill((0, 0, 0, 150))
+        self._freeze_tint = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._freeze_tint.fill((40, 80, 140, 20))
+        self._ghost_tint = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._ghost_tint.fill((140, 30, 30, 15))
         self.high_score = 0
         self.sound = SoundManager()
         self.disco_mode = False
-        self.konami_buffer: list[int] = []
+        self.konami_buffer: deque[int] = deque(maxlen=len(KONAMI_CODE))
         self.disco_flash_timer = 0.0
         self.menu_time = 0.0
         self.state = GameState.MENU
@@ -78,12 +109,15 @@ class Game:
         self.item = Item(WIDTH, HEIGHT)
         self.powerup = Powerup(WIDTH, HEIGHT)
         self.active_effects: list[ActiveEffect] = []
+        self._effect_mask = 0  # OR of EFFECT_BITS for active_effects
         self.score = 0
         self.echo_timer = 0.0
         self.echo_count = 0
         self.game_time = 0.0
         self.state = GameState.PLAYING
         self.ghosts_eaten = 0
+        # Drop text rendered for the previous run (old scores, counters)
+        self._text_cache.clear()
         # Reset disco mode per run
         if self.disco_mode:
             self.disco_mode = False
@@ -92,9 +126,36 @@ class Game:
             self.sound.stop_music()
             self.sound.play_music()
 
+    def _text(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Render text, reusing the surface from an earlier identical call.
+
+        Args:
+            font: Font to render with.
+            text: String to render.
+            color: RGB text color.
+
+        Returns:
+            Antialiased text surface.
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+
     def _has_effect(self, powerup_type: PowerupType) -> bool:
         """Check if a powerup effect is currently active."""
-        return any(e.powerup_type == powerup_type for e in self.active_effects)
+        return bool(self._effect_mask & EFFECT_BITS[powerup_type])
+
+    def _add_effect(self, powerup_type: PowerupType) -> None:
+        """Start a powerup effect."""
+        self.active_effects.append(ActiveEffect(powerup_type))
+        self._effect_mask |= EFFECT_BITS[powerup_type]
 
     async def run(self) -> bool:
         """Run the game loop.
@@ -102,10 +163,21 @@ class Game:
         Returns:
             False when the game should quit.
         """
+        accumulator = 0.0
+        last_time = time.monotonic()
+        self._next_frame = last_time
         while True:
-            dt = self.clock.tick(FPS) / 1000.0
+            # The game over screen is static: poll slowly and only repaint on input
+            idle = self.state == GameState.GAME_OVER
+            frame_time = 1.0 / (IDLE_FPS if idle else FPS)
+            now = time.monotonic()
+            dt = now - last_time
+            last_time = now
+            needs_redraw = not idle
+            was_playing = self.state == GameState.PLAYING
 
             for event in pygame.event.get():
+                needs_redraw = True
                 if event.type == pygame.QUIT:
                     return False
                 elif event.type == pygame.KEYDOWN:
@@ -133,9 +205,27 @@ class Game:
             if self.state == GameState.MENU:
                 self.menu_time += dt
             elif self.state == GameState.PLAYING:
-                self._update(dt)
-            self._draw()
-            await asyncio.sleep(0)
+                # Fixed-step simulation so late frames don't slow the game down
+                if was_playing:
+                    accumulator = min(accumulator + dt, MAX_CATCHUP_STEPS * FIXED_DT)
+                else:
+                    accumulator = FIXED_DT  # just started or resumed
+                while accumulator >= FIXED_DT and self.state == GameState.PLAYING:
+                    self._update(FIXED_DT)
+                    accumulator -= FIXED_DT
+            if needs_redraw:
+                self._draw()
+
+            # Sleep once until the next frame deadline instead of blocking in
+            # clock.tick and then yielding again
+            self._next_frame += frame_time
+            delay = self._next_frame - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # Running behind: resync rather than bursting to catch up
+                self._next_frame = time.monotonic()
+                await asyncio.sleep(0)
 
         return True
 
@@ -151,8 +241,18 @@ class Game:
         if self.disco_flash_timer > 0:
             self.disco_flash_timer -= dt
 
-        # Update active effects
-        self.active_effects = [e for e in self.active_effects if e.update(dt)]
+        # Update active effects, dropping expired ones in place
+        effects = self.active_effects
+        expired = False
+        for i in range(len(effects) - 1, -1, -1):
+            if not effects[i].update(dt):
+                del effects[i]
+                expired = True
+        if expired:
+            # Rebuild the mask, another effect of the same type may still be running
+            self._effect_mask = 0
+            for effect in effects:
+                self._effect_mask |= EFFECT_BITS[effect.powerup_type]
 
         # Apply shrink effect to player
         if self._has_effect(PowerupType.SHRINK):
@@ -161,17 +261,10 @@ class Game:
             self.player.RADIUS = NORMAL_RADIUS
 
         # Handle movement input
+        # Key states are 0/1, so opposite directions simply cancel out
         keys = pygame.key.get_pressed()
-        dx = 0
-        dy = 0
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            dy = -1
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            dy = 1
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            dx = -1
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            dx = 1
+        dx = (keys[pygame.K_d] or keys[pygame.K_RIGHT]) - (keys[pygame.K_a] or keys[pygame.K_LEFT])
+        dy = (keys[pygame.K_s] or keys[pygame.K_DOWN]) - (keys[pygame.K_w] or keys[pygame.K_UP])
 
         self.player.move(dx, dy, WIDTH, HEIGHT)
 
@@ -179,7 +272,7 @@ class Game:
         self.echo_timer += dt
         if self.echo_timer >= ECHO_INTERVAL:
             self.echo_timer = 0.0
-            new_echo = Echo(self.player.path_history, self.echo_count)
+            new_echo = Echo.from_history(*self.player.snapshot(), self.echo_count)
             self.echoes.append(new_echo)
             self.echo_count += 1
             self.sound.play("echo_spawn")
@@ -203,46 +296,56 @@ class Game:
         if self.powerup.collides_with(self.player.x, self.player.y, self.player.RADIUS):
             ptype = self.powerup.collect()
             if ptype:
-                self.active_effects.append(ActiveEffect(ptype))
+                self._add_effect(ptype)
                 self.sound.play(f"pickup_{ptype.value}")
 
         # Check collision with echoes
         if self.game_time > COLLISION_GRACE:
-            is_ghost_eater = self._has_effect(PowerupType.GHOST_EATER)
-            for echo in self.echoes[:]:  # Copy list since we may modify
-                if echo.frame_index > FPS * COLLISION_GRACE:
-                    dist = math.sqrt(
-                        (self.player.x - echo.x) ** 2 +
-                        (self.player.y - echo.y) ** 2
-                    )
-                    if dist < (self.player.RADIUS + echo.RADIUS - 4):
-                        if is_ghost_eater:
-                            self.echoes.remove(echo)
-                            self.ghosts_eaten += 1
-                            self.score += 3  # Bonus points for eating
-                            self.sound.play("ghost_eaten")
-                        else:
-                            self._game_over()
-                            return
+            # Find every touching echo in a single pass, then resolve only those
+            # Loop-invariant values bound once; compare squared distances so no sqrt is needed
+            px = self.player.x
+            py = self.player.y
+            grace_frames = FPS * COLLISION_GRACE
+            thresh2 = (self.player.RADIUS + Echo.RADIUS - 4) ** 2
+            hits = [
+                echo for echo in self.echoes
+                if echo.frame_index > grace_frames
+                and (px - echo.cur_x) ** 2 + (py - echo.cur_y) ** 2 < thresh2
+            ]
+            if hits:
+                if not self._has_effect(PowerupType.GHOST_EATER):
+                    self._game_over()
+                    return
+                # Drop every eaten echo in one pass instead of a list.remove() search per hit
+                eaten = set(hits)
+                self.echoes = [echo for echo in self.echoes if echo not in eaten]
+                for _ in hits:
+                    self.ghosts_eaten += 1
+                    self.score += 3  # Bonus points for eating
+                    self.sound.play("ghost_eaten")
 
     def _check_konami(self, key: int) -> None:
         """Track key presses and activate disco mode on Konami code."""
         self.konami_buffer.append(key)
-        if len(self.konami_buffer) > len(KONAMI_CODE):
-            self.konami_buffer.pop(0)
-        if self.konami_buffer == KONAMI_CODE and not self.disco_mode:
+        if not self.disco_mode and tuple(self.konami_buffer) == _KONAMI_TUPLE:
             self.disco_mode = True
             self.disco_flash_timer = 2.0
             self.sound.play("konami_jingle")
             self.sound.play_disco_music()
 
     @staticmethod
-    def _disco_color(offset: float, speed: float = 3.0) -> tuple[int, int, int]:
-        """Generate a rainbow color cycling over time."""
-        r = int((math.sin(offset * speed) * 0.5 + 0.5) * 255)
-        g = int((math.sin(offset * speed + 2.094) * 0.5 + 0.5) * 255)
-        b = int((math.sin(offset * speed + 4.189) * 0.5 + 0.5) * 255)
-        return (r, g, b)
+    def _disco_color(offset: float, speed: float = 3.0,
+                     steps: int = DISCO_LUT_SIZE) -> tuple[int, int, int]:
+        """Generate a rainbow color cycling over time.
+
+        Args:
+            offset: Position in the cycle, usually a time in seconds.
+            speed: Cycle speed multiplier.
+            steps: Number of distinct colors per cycle (power of two).
+        """
+        idx = int(offset * speed * DISCO_LUT_SIZE / (2 * math.pi)) & (DISCO_LUT_SIZE - 1)
+        idx -= idx % (DISCO_LUT_SIZE // steps)
+        return _DISCO_LUT[idx]
 
     def _game_over(self) -> None:
         """Handle game over."""
@@ -268,13 +371,9 @@ class Game:
 
         # Tint screen during effects
         if self._has_effect(PowerupType.TIME_FREEZE):
-            tint = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            tint.fill((40, 80, 140, 20))
-            self.screen.blit(tint, (0, 0))
+            self.screen.blit(self._freeze_tint, (0, 0))
         elif self._has_effect(PowerupType.GHOST_EATER):
-            tint = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            tint.fill((140, 30, 30, 15))
-            self.screen.blit(tint, (0, 0))
+            self.screen.blit(self._ghost_tint, (0, 0))
 
         # Draw item
         self.item.draw(self.screen)
@@ -282,11 +381,14 @@ class Game:
         # Draw powerup
         self.powerup.draw(self.screen)
 
-        # Draw echoes (rainbow colors in disco mode)
+        # Draw echoes (rainbow colors in disco mode) with a single batched blit
+        echo_blits = []
         for i, echo in enumerate(self.echoes):
             if self.disco_mode:
-                echo.color = self._disco_color(self.game_time + i * 0.5)
-            echo.draw(self.screen)
+                # Only swaps sprites when the quantized color actually changes
+                echo.color = self._disco_color(self.game_time + i * 0.5, steps=ECHO_DISCO_STEPS)
+            echo_blits.extend(echo.draw_items())
+        self.screen.blits(echo_blits, doreturn=False)
 
         # Draw player (with visual effect if powered up)
         self._draw_player()
@@ -328,21 +430,21 @@ class Game:
     def _draw_ui(self) -> None:
         """Draw score and info overlay."""
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
+        score_text = self._text(self.font, f"Score: {self.score}", (255, 255, 255))
         self.screen.blit(score_text, (20, 15))
 
         # High score
         if self.high_score > 0:
-            hs_text = self.small_font.render(f"Best: {self.high_score}", True, (100, 100, 120))
+            hs_text = self._text(self.small_font, f"Best: {self.high_score}", (100, 100, 120))
             self.screen.blit(hs_text, (20, 50))
 
         # Echo countdown
         time_to_next = ECHO_INTERVAL - self.echo_timer
-        countdown_text = self.small_font.render(f"Next echo: {time_to_next:.1f}s", True, (100, 100, 120))
+        countdown_text = self._text(self.small_font, f"Next echo: {time_to_next:.1f}s", (100, 100, 120))
         self.screen.blit(countdown_text, (WIDTH - 180, 15))
 
         # Echo count
-        echo_text = self.small_font.render(f"Echoes: {len(self.echoes)}", True, (100, 100, 120))
+        echo_text = self._text(self.small_font, f"Echoes: {len(self.echoes)}", (100, 100, 120))
         self.screen.blit(echo_text, (WIDTH - 180, 45))
 
     def _draw_effects(self) -> None:
@@ -355,34 +457,32 @@ class Game:
     def _draw_game_over(self) -> None:
         """Draw game over overlay."""
         # Dark overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay, (0, 0))
 
         # Game over text
-        go_text = self.big_font.render("GAME OVER", True, (255, 80, 80))
+        go_text = self._text(self.big_font, "GAME OVER", (255, 80, 80))
         go_rect = go_text.get_rect(center=(WIDTH // 2, HEIGHT // 3))
         self.screen.blit(go_text, go_rect)
 
         # Final score
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
+        score_text = self._text(self.font, f"Score: {self.score}", (255, 255, 255))
         score_rect = score_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 20))
         self.screen.blit(score_text, score_rect)
 
         # Ghosts eaten
         if self.ghosts_eaten > 0:
-            eaten_text = self.small_font.render(f"Ghosts eaten: {self.ghosts_eaten}", True, (255, 80, 80))
+            eaten_text = self._text(self.small_font, f"Ghosts eaten: {self.ghosts_eaten}", (255, 80, 80))
             eaten_rect = eaten_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 15))
             self.screen.blit(eaten_text, eaten_rect)
 
         # High score
         if self.high_score > 0:
-            hs_text = self.font.render(f"Best: {self.high_score}", True, (255, 220, 50))
+            hs_text = self._text(self.font, f"Best: {self.high_score}", (255, 220, 50))
             hs_rect = hs_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 50))
             self.screen.blit(hs_text, hs_rect)
 
         # Restart instruction
-        restart_text = self.small_font.render("R to restart | ESC for menu", True, (150, 150, 150))
+        restart_text = self._text(self.small_font, "R to restart | ESC for menu", (150, 150, 150))
         restart_rect = restart_text.get_rect(center=(WIDTH // 2, HEIGHT * 2 // 3))
         self.screen.blit(restart_text, restart_rect)
 
@@ -392,19 +492,22 @@ class Game:
 
         # Title with subtle pulse
         pulse = 0.9 + 0.1 * math.sin(self.menu_time * 2)
-        title_font = pygame.font.Font(None, int(90 * pulse))
-        title_text = title_font.render("ECHO", True, (80, 160, 255))
+        size = int(90 * pulse)
+        title_font = self._title_fonts.get(size)
+        if title_font is None:
+            title_font = self._title_fonts[size] = pygame.font.Font(None, size)
+        title_text = self._text(title_font, "ECHO", (80, 160, 255))
         title_rect = title_text.get_rect(center=(WIDTH // 2, HEIGHT // 3 - 20))
         self.screen.blit(title_text, title_rect)
 
         # Subtitle
-        sub_text = self.small_font.render("Your past becomes your enemy", True, (100, 100, 140))
+        sub_text = self._text(self.small_font, "Your past becomes your enemy", (100, 100, 140))
         sub_rect = sub_text.get_rect(center=(WIDTH // 2, HEIGHT // 3 + 30))
         self.screen.blit(sub_text, sub_rect)
 
         # Blinking "Press ENTER to play"
         if int(self.menu_time * 2) % 2 == 0:
-            play_text = self.font.render("Press ENTER to play", True, (200, 200, 220))
+            play_text = self._text(self.font, "Press ENTER to play", (200, 200, 220))
             play_rect = play_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
             self.screen.blit(play_text, play_rect)
 
@@ -415,31 +518,29 @@ class Game:
         ]
         y = HEIGHT // 2 + 90
         for line in controls:
-            ctrl_text = self.small_font.render(line, True, (80, 80, 100))
+            ctrl_text = self._text(self.small_font, line, (80, 80, 100))
             ctrl_rect = ctrl_text.get_rect(center=(WIDTH // 2, y))
             self.screen.blit(ctrl_text, ctrl_rect)
             y += 25
 
         # High score
         if self.high_score > 0:
-            hs_text = self.font.render(f"Best: {self.high_score}", True, (255, 220, 50))
+            hs_text = self._text(self.font, f"Best: {self.high_score}", (255, 220, 50))
             hs_rect = hs_text.get_rect(center=(WIDTH // 2, HEIGHT - 60))
             self.screen.blit(hs_text, hs_rect)
 
     def _draw_paused(self) -> None:
         """Draw pause overlay."""
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay, (0, 0))
 
-        pause_text = self.big_font.render("PAUSED", True, (200, 200, 220))
+        pause_text = self._text(self.big_font, "PAUSED", (200, 200, 220))
         pause_rect = pause_text.get_rect(center=(WIDTH // 2, HEIGHT // 3))
         self.screen.blit(pause_text, pause_rect)
 
-        resume_text = self.font.render("P / ESC to resume", True, (150, 150, 170))
+        resume_text = self._text(self.font, "P / ESC to resume", (150, 150, 170))
         resume_rect = resume_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
         self.screen.blit(resume_text, resume_rect)
 
-        quit_text = self.small_font.render("Q to quit to menu", True, (100, 100, 120))
+        quit_text = self._text(self.small_font, "Q to quit to menu", (100, 100, 120))
         quit_rect = quit_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 40))
         self.screen.blit(quit_text, quit_rect)
@@ -4,6 +4,11 @@ import pygame
 import random
 import math
 
+try:
+    from sprites import circle_surface
+except ImportError:
+    from src.sprites import circle_surface
+
 
 class Item:
     """A collectible item that spawns at random positions."""
@@ -44,10 +49,15 @@ class Item:
         Returns:
             True if collision detected.
         """
+        r = self.RADIUS + pradius
+        # Cheap per-axis bounding-box reject, then compare squared distances
         dx = self.x - px
+        if dx > r or dx < -r:
+            return False
         dy = self.y - py
-        distance = math.sqrt(dx * dx + dy * dy)
-        return distance < (self.RADIUS + pradius)
+        if dy > r or dy < -r:
+            return False
+        return dx * dx + dy * dy < r * r
 
     def update(self, dt: float) -> None:
         """Update item animation.
@@ -66,8 +76,7 @@ class Item:
         # Pulsing glow
         pulse = math.sin(self.pulse_time * 4) * 0.3 + 0.7
         glow_radius = int((self.RADIUS + 12) * pulse)
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, self.GLOW_COLOR, (glow_radius, glow_radius), glow_radius)
+        glow_surface = circle_surface(self.GLOW_COLOR, glow_radius)
         screen.blit(glow_surface, (int(self.x) - glow_radius, int(self.y) - glow_radius))
 
         # Draw item circle
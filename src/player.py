@@ -1,7 +1,15 @@
 """Player module - movement and path recording."""
 
+from array import array
+from collections import deque
+
 import pygame
 
+try:
+    from sprites import circle_surface
+except ImportError:
+    from src.sprites import circle_surface
+
 
 class Player:
     """The player character that records its movement history."""
@@ -21,8 +29,10 @@ class Player:
         """
         self.x = x
         self.y = y
-        self.path_history: list[tuple[float, float]] = []
-        self.trail: list[tuple[float, float]] = []
+        # Append-only per-axis position history; echoes share these arrays
+        self.path_x = array("d")
+        self.path_y = array("d")
+        self.trail: deque[tuple[float, float]] = deque(maxlen=self.TRAIL_LENGTH)
 
     def move(self, dx: float, dy: float, screen_width: int, screen_height: int) -> None:
         """Move the player and record position.
@@ -46,13 +56,20 @@ class Player:
         self.y = max(self.RADIUS, min(screen_height - self.RADIUS, self.y))
 
         # Record position
-        pos = (self.x, self.y)
-        self.path_history.append(pos)
+        self.path_x.append(self.x)
+        self.path_y.append(self.y)
 
         # Update trail
-        self.trail.append(pos)
-        if len(self.trail) > self.TRAIL_LENGTH:
-            self.trail.pop(0)
+        self.trail.append((self.x, self.y))
+
+    def snapshot(self) -> tuple[array, array, int]:
+        """Get the recorded path for an echo to replay, without copying.
+
+        Returns:
+            Tuple of (path_x, path_y, length). Recording only ever appends,
+            so the first `length` entries stay valid for the echo's lifetime.
+        """
+        return self.path_x, self.path_y, len(self.path_x)
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the player with trail effect.
@@ -64,14 +81,12 @@ class Player:
         for i, (tx, ty) in enumerate(self.trail):
             alpha = int(255 * (i + 1) / len(self.trail)) if self.trail else 255
             radius = max(2, int(self.RADIUS * (i + 1) / len(self.trail)))
-            trail_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, (*self.COLOR, alpha // 3), (radius, radius), radius)
+            trail_surface = circle_surface((*self.COLOR, alpha // 3), radius)
             screen.blit(trail_surface, (int(tx) - radius, int(ty) - radius))
 
         # Draw glow
         glow_radius = self.RADIUS + 8
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, self.GLOW_COLOR, (glow_radius, glow_radius), glow_radius)
+        glow_surface = circle_surface(self.GLOW_COLOR, glow_radius)
         screen.blit(glow_surface, (int(self.x) - glow_radius, int(self.y) - glow_radius))
 
         # Draw player circle
@@ -98,5 +113,7 @@ class Player:
         """
         self.x = x
         self.y = y
-        self.path_history.clear()
+        # Start fresh arrays so echoes replaying the old history are unaffected
+        self.path_x = array("d")
+        self.path_y = array("d")
         self.trail.clear()
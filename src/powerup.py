@@ -4,6 +4,12 @@ import pygame
 import random
 import math
 from enum import Enum
+from typing import NamedTuple
+
+try:
+    from sprites import circle_surface
+except ImportError:
+    from src.sprites import circle_surface
 
 
 class PowerupType(Enum):
@@ -13,40 +19,73 @@ class PowerupType(Enum):
     SHRINK = "shrink"
 
 
+class PowerupSpec(NamedTuple):
+    """Static configuration of a powerup type."""
+    color: tuple[int, int, int]
+    glow_color: tuple[int, int, int, int]
+    icon: str
+    duration: float
+    spawn_weight: int
+    label: str
+
+
 # Powerup configurations
-POWERUP_CONFIG = {
-    PowerupType.GHOST_EATER: {
-        "color": (255, 50, 50),       # Red
-        "glow_color": (255, 50, 50, 80),
-        "icon": "skull",              # Will draw a skull shape
-        "duration": 5.0,
-        "spawn_weight": 2,            # Rarer than others
-        "label": "GHOST EATER",
-    },
-    PowerupType.TIME_FREEZE: {
-        "color": (80, 180, 255),      # Ice blue
-        "glow_color": (80, 180, 255, 80),
-        "icon": "snowflake",          # Will draw a snowflake shape
-        "duration": 5.0,
-        "spawn_weight": 3,            # Common
-        "label": "TIME FREEZE",
-    },
-    PowerupType.SHRINK: {
-        "color": (180, 80, 255),      # Purple
-        "glow_color": (180, 80, 255, 80),
-        "icon": "diamond",            # Will draw a diamond shape
-        "duration": 6.0,
-        "spawn_weight": 3,            # Common
-        "label": "SHRINK",
-    },
+POWERUP_CONFIG: dict[PowerupType, PowerupSpec] = {
+    PowerupType.GHOST_EATER: PowerupSpec(
+        color=(255, 50, 50),       # Red
+        glow_color=(255, 50, 50, 80),
+        icon="skull",              # Will draw a skull shape
+        duration=5.0,
+        spawn_weight=2,            # Rarer than others
+        label="GHOST EATER",
+    ),
+    PowerupType.TIME_FREEZE: PowerupSpec(
+        color=(80, 180, 255),      # Ice blue
+        glow_color=(80, 180, 255, 80),
+        icon="snowflake",          # Will draw a snowflake shape
+        duration=5.0,
+        spawn_weight=3,            # Common
+        label="TIME FREEZE",
+    ),
+    PowerupType.SHRINK: PowerupSpec(
+        color=(180, 80, 255),      # Purple
+        glow_color=(180, 80, 255, 80),
+        icon="diamond",            # Will draw a diamond shape
+        duration=6.0,
+        spawn_weight=3,            # Common
+        label="SHRINK",
+    ),
 }
 
+# Weighted spawn table, fixed at import time
+_SPAWN_TYPES = tuple(POWERUP_CONFIG)
+_SPAWN_WEIGHTS = tuple(config.spawn_weight for config in POWERUP_CONFIG.values())
+
+# Glow pulse (sin * 0.4 + 0.8) over one cycle, sampled into a lookup table
+PULSE_LUT_SIZE = 256
+_PULSE_LUT = tuple(
+    math.sin(2 * math.pi * i / PULSE_LUT_SIZE) * 0.4 + 0.8 for i in range(PULSE_LUT_SIZE)
+)
+
+# Unit vectors for the six snowflake arms (0, 60, ..., 300 degrees)
+_SNOWFLAKE_DIRS = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for angle in range(0, 360, 60)
+)
+
+# Pre-rendered ring, fill and icon per powerup type, built on first draw
+_ICON_CACHE: dict[PowerupType, pygame.Surface] = {}
+
+# Indicator font, created on first use (pygame.font must be initialized)
+_INDICATOR_FONT: pygame.font.Font | None = None
+
 
 class Powerup:
     """A powerup that spawns on the field and grants temporary effects."""
 
     RADIUS = 12
     MARGIN = 50
+    ICON_SIZE = (RADIUS + 8) * 2
 
     def __init__(self, screen_width: int, screen_height: int):
         """Initialize powerup.
@@ -60,11 +99,24 @@ class Powerup:
         self.x = 0.0
         self.y = 0.0
         self.active = False
-        self.powerup_type: PowerupType = PowerupType.TIME_FREEZE
+        self.powerup_type = PowerupType.TIME_FREEZE
         self.pulse_time = 0.0
         self.spawn_timer = 0.0
         self.spawn_interval = 8.0  # seconds between powerup spawns
 
+    @property
+    def powerup_type(self) -> PowerupType:
+        """Current powerup type."""
+        return self._powerup_type
+
+    @powerup_type.setter
+    def powerup_type(self, value: PowerupType) -> None:
+        # Keep the config values draw needs as plain attributes
+        self._powerup_type = value
+        config = POWERUP_CONFIG[value]
+        self._color = config.color
+        self._glow_color = config.glow_color
+
     def update(self, dt: float) -> None:
         """Update powerup state.
 
@@ -85,10 +137,7 @@ class Powerup:
         self.pulse_time = 0.0
 
         # Weighted random type selection (ghost eater is rarer)
-        types = []
-        for ptype, config in POWERUP_CONFIG.items():
-            types.extend([ptype] * config["spawn_weight"])
-        self.powerup_type = random.choice(types)
+        self.powerup_type = random.choices(_SPAWN_TYPES, _SPAWN_WEIGHTS)[0]
 
         # Random position
         self.x = random.uniform(self.MARGIN, self.screen_width - self.MARGIN)
@@ -119,10 +168,15 @@ class Powerup:
         """
         if not self.active:
             return False
+        r = self.RADIUS + pradius
+        # Cheap per-axis bounding-box reject, then compare squared distances
         dx = self.x - px
+        if dx > r or dx < -r:
+            return False
         dy = self.y - py
-        distance = math.sqrt(dx * dx + dy * dy)
-        return distance < (self.RADIUS + pradius)
+        if dy > r or dy < -r:
+            return False
+        return dx * dx + dy * dy < r * r
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the powerup with distinct icon per type.
@@ -133,32 +187,46 @@ class Powerup:
         if not self.active:
             return
 
-        config = POWERUP_CONFIG[self.powerup_type]
-        color = config["color"]
-        glow_color = config["glow_color"]
-
         # Pulsing glow
-        pulse = math.sin(self.pulse_time * 5) * 0.4 + 0.8
+        idx = int(self.pulse_time * 5 * PULSE_LUT_SIZE / (2 * math.pi)) & (PULSE_LUT_SIZE - 1)
+        pulse = _PULSE_LUT[idx]
         glow_radius = int((self.RADIUS + 16) * pulse)
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
+        glow_surface = circle_surface(self._glow_color, glow_radius)
         screen.blit(glow_surface, (int(self.x) - glow_radius, int(self.y) - glow_radius))
 
+        # Ring, fill and icon never change for a type: blit the cached sprite
+        icon = _ICON_CACHE.get(self._powerup_type)
+        if icon is None:
+            icon = _ICON_CACHE[self._powerup_type] = self._render_icon(self._color, self._powerup_type)
+        half = self.ICON_SIZE // 2
+        screen.blit(icon, (int(self.x) - half, int(self.y) - half))
+
+    def _render_icon(self, color: tuple, powerup_type: PowerupType) -> pygame.Surface:
+        """Render the ring, inner fill and icon onto a transparent sprite.
+
+        Args:
+            color: Powerup color.
+            powerup_type: Type whose icon to draw.
+
+        Returns:
+            Surface of size (ICON_SIZE, ICON_SIZE) centered on the powerup.
+        """
+        surface = pygame.Surface((self.ICON_SIZE, self.ICON_SIZE), pygame.SRCALPHA)
+        cx = cy = self.ICON_SIZE // 2
+
         # Outer ring
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.RADIUS + 2, 2)
+        pygame.draw.circle(surface, color, (cx, cy), self.RADIUS + 2, 2)
 
         # Inner fill (darker)
         dark_color = (color[0] // 3, color[1] // 3, color[2] // 3)
-        pygame.draw.circle(screen, dark_color, (int(self.x), int(self.y)), self.RADIUS)
+        pygame.draw.circle(surface, dark_color, (cx, cy), self.RADIUS)
 
         # Draw icon based on type
-        cx, cy = int(self.x), int(self.y)
-        if config["icon"] == "skull":
-            self._draw_skull(screen, cx, cy, color)
-        elif config["icon"] == "snowflake":
-            self._draw_snowflake(screen, cx, cy, color)
-        elif config["icon"] == "diamond":
-            self._draw_diamond(screen, cx, cy, color)
+        self._ICON_DRAW[powerup_type](self, surface, cx, cy, color)
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
 
     def _draw_skull(self, screen: pygame.Surface, cx: int, cy: int, color: tuple) -> None:
         """Draw skull icon (ghost eater)."""
@@ -174,10 +242,9 @@ class Powerup:
         """Draw snowflake icon (time freeze)."""
         # Six lines radiating from center
         length = 7
-        for angle_deg in range(0, 360, 60):
-            angle = math.radians(angle_deg)
-            ex = cx + int(length * math.cos(angle))
-            ey = cy + int(length * math.sin(angle))
+        for ux, uy in _SNOWFLAKE_DIRS:
+            ex = cx + int(length * ux)
+            ey = cy + int(length * uy)
             pygame.draw.line(screen, color, (cx, cy), (ex, ey), 1)
         # Center dot
         pygame.draw.circle(screen, color, (cx, cy), 2)
@@ -204,6 +271,14 @@ class Powerup:
         pygame.draw.polygon(screen, color, inner)
 
 
+# Icon drawing functions keyed by type
+Powerup._ICON_DRAW = {
+    PowerupType.GHOST_EATER: Powerup._draw_skull,
+    PowerupType.TIME_FREEZE: Powerup._draw_snowflake,
+    PowerupType.SHRINK: Powerup._draw_diamond,
+}
+
+
 class ActiveEffect:
     """Tracks an active powerup effect on the player."""
 
@@ -215,10 +290,12 @@ class ActiveEffect:
         """
         self.powerup_type = powerup_type
         config = POWERUP_CONFIG[powerup_type]
-        self.duration = config["duration"]
-        self.remaining = config["duration"]
-        self.label = config["label"]
-        self.color = config["color"]
+        self.duration = config.duration
+        self.remaining = config.duration
+        self.progress = 1.0  # remaining fraction (1.0 = full, 0.0 = expired)
+        self.label = config.label
+        self.color = config.color
+        self._label_surface: pygame.Surface | None = None
 
     def update(self, dt: float) -> bool:
         """Update effect timer.
@@ -230,13 +307,9 @@ class ActiveEffect:
             True if effect is still active.
         """
         self.remaining -= dt
+        self.progress = max(0.0, self.remaining / self.duration)
         return self.remaining > 0
 
-    @property
-    def progress(self) -> float:
-        """Get remaining progress (1.0 = full, 0.0 = expired)."""
-        return max(0.0, self.remaining / self.duration)
-
     def draw_indicator(self, screen: pygame.Surface, x: int, y: int) -> None:
         """Draw effect indicator bar.
 
@@ -266,7 +339,10 @@ class ActiveEffect:
         # Border
         pygame.draw.rect(screen, self.color, bg_rect, 1)
 
-        # Label text
-        font = pygame.font.Font(None, 20)
-        label = font.render(self.label, True, (255, 255, 255))
-        screen.blit(label, (x + 4, y + 1))
+        # Label text (the label never changes, so render it once)
+        if self._label_surface is None:
+            global _INDICATOR_FONT
+            if _INDICATOR_FONT is None:
+                _INDICATOR_FONT = pygame.font.Font(None, 20)
+            self._label_surface = _INDICATOR_FONT.render(self.label, True, (255, 255, 255))
+        screen.blit(self._label_surface, (x + 4, y + 1))
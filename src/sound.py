@@ -1,12 +1,18 @@
 """Sound module - procedural audio generation for all game sounds."""
 
+import functools
 import math
-import struct
+import sys
+from array import array
+
 import pygame
 
 SAMPLE_RATE = 44100
+# PCM buffers are little-endian int16; array('h') uses native byte order
+_BIG_ENDIAN = sys.byteorder == "big"
 
 
+@functools.lru_cache(maxsize=None)
 def _tone(frequency: float, duration: float, volume: float = 0.3,
           wave: str = "sine", fade_out: float = 0.0) -> bytes:
     """Generate raw PCM samples for a tone.
@@ -23,36 +29,33 @@ def _tone(frequency: float, duration: float, volume: float = 0.3,
     """
     n_samples = int(SAMPLE_RATE * duration)
     fade_samples = int(SAMPLE_RATE * fade_out) if fade_out > 0 else 0
-    buf = bytearray(n_samples * 2)
-
-    for i in range(n_samples):
-        t = i / SAMPLE_RATE
-
-        if wave == "sine":
-            val = math.sin(2 * math.pi * frequency * t)
-        elif wave == "square":
-            val = 1.0 if math.sin(2 * math.pi * frequency * t) >= 0 else -1.0
-        elif wave == "triangle":
-            phase = (frequency * t) % 1.0
-            val = 4.0 * abs(phase - 0.5) - 1.0
-        else:
-            val = math.sin(2 * math.pi * frequency * t)
-
-        # Apply fade out
-        if fade_samples > 0 and i >= n_samples - fade_samples:
-            fade = (n_samples - i) / fade_samples
-            val *= fade
-
-        sample = int(val * volume * 32767)
-        sample = max(-32768, min(32767, sample))
-        struct.pack_into('<h', buf, i * 2, sample)
-
-    return bytes(buf)
+    omega = 2 * math.pi * frequency
+    sin = math.sin
+
+    # Build the whole waveform per wave type instead of dispatching per sample
+    if wave == "square":
+        vals = [1.0 if sin(omega * (i / SAMPLE_RATE)) >= 0 else -1.0
+                for i in range(n_samples)]
+    elif wave == "triangle":
+        vals = [4.0 * abs((frequency * (i / SAMPLE_RATE)) % 1.0 - 0.5) - 1.0
+                for i in range(n_samples)]
+    else:
+        vals = [sin(omega * (i / SAMPLE_RATE)) for i in range(n_samples)]
+
+    # Apply fade out
+    for i in range(max(0, n_samples - fade_samples), n_samples):
+        vals[i] *= (n_samples - i) / fade_samples
+
+    samples = array('h', [max(-32768, min(32767, int(val * volume * 32767)))
+                          for val in vals])
+    if _BIG_ENDIAN:
+        samples.byteswap()
+    return samples.tobytes()
 
 
 def _silence(duration: float) -> bytes:
     """Generate silence."""
-    return b'\x00\x00' * int(SAMPLE_RATE * duration)
+    return bytes(int(SAMPLE_RATE * duration) * 2)
 
 
 def _mix(*buffers: bytes) -> bytes:
@@ -60,20 +63,29 @@ def _mix(*buffers: bytes) -> bytes:
     if not buffers:
         return b''
     max_len = max(len(b) for b in buffers)
-    result = bytearray(max_len)
-
-    for i in range(0, max_len, 2):
-        total = 0
-        count = 0
-        for buf in buffers:
-            if i + 1 < len(buf):
-                total += struct.unpack_from('<h', buf, i)[0]
-                count += 1
-        if count > 0:
-            mixed = max(-32768, min(32767, total // count))
-            struct.pack_into('<h', result, i, mixed)
-
-    return bytes(result)
+    tracks = []
+    for buf in buffers:
+        track = array('h')
+        track.frombytes(buf[:len(buf) & ~1])
+        if _BIG_ENDIAN:
+            track.byteswap()
+        tracks.append(track)
+    tracks.sort(key=len, reverse=True)
+
+    # Average span by span: within each span the same tracks are still
+    # playing, so the divisor is constant and the sums run in C via zip
+    mixed = array('h')
+    start = 0
+    for count in range(len(tracks), 0, -1):
+        end = len(tracks[count - 1])
+        if end > start:
+            spans = [track[start:end] for track in tracks[:count]]
+            mixed.extend([total // count for total in map(sum, zip(*spans))])
+            start = end
+
+    if _BIG_ENDIAN:
+        mixed.byteswap()
+    return mixed.tobytes().ljust(max_len, b'\x00')
 
 
 def _concat(*buffers: bytes) -> bytes:
@@ -87,6 +99,7 @@ class SoundManager:
     def __init__(self):
         """Initialize and generate all sounds."""
         self.enabled = True
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
         try:
             if not pygame.mixer.get_init():
                 self.enabled = False
@@ -94,8 +107,15 @@ class SoundManager:
             self._generate_sfx()
             self._generate_music()
             self._generate_disco_music()
+            # Name -> Sound lookup for play()
+            self._sounds = {name: sound for name, sound in vars(self).items()
+                            if isinstance(sound, pygame.mixer.Sound)}
         except Exception:
             self.enabled = False
+        finally:
+            # Repeated notes are rendered once while generating; drop the
+            # raw buffers now that they live in the Sound objects
+            _tone.cache_clear()
 
     def _generate_sfx(self) -> None:
         """Generate all sound effects."""
@@ -283,6 +303,6 @@ class SoundManager:
         """
         if not self.enabled:
             return
-        sound = getattr(self, sound_name, None)
-        if sound and isinstance(sound, pygame.mixer.Sound):
+        sound = self._sounds.get(sound_name)
+        if sound is not None:
             sound.play()
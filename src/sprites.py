@@ -0,0 +1,37 @@
+"""Sprites module - shared cache of pre-rendered transparent shapes."""
+
+from collections import OrderedDict
+
+import pygame
+
+CACHE_SIZE = 1024
+
+# Pre-drawn circle surfaces keyed by (rgba, radius), least recently used first
+_circle_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+
+def circle_surface(color: tuple[int, int, int, int], radius: int) -> pygame.Surface:
+    """Get a cached transparent surface with a filled circle.
+
+    Args:
+        color: RGBA color of the circle.
+        radius: Circle radius in pixels.
+
+    Returns:
+        Surface of size (radius * 2, radius * 2) with the circle drawn.
+        Shared between callers, so it must not be drawn on.
+    """
+    key = (color, radius)
+    surface = _circle_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        # Match the display's pixel format so blits take the fast path
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _circle_cache[key] = surface
+        if len(_circle_cache) > CACHE_SIZE:
+            _circle_cache.popitem(last=False)
+    else:
+        _circle_cache.move_to_end(key)
+    return surface
@@ -3,6 +3,8 @@
 import sys
 import os
 import math
+import struct
+from collections import deque
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -11,6 +13,7 @@ from src.echo import Echo, ECHO_COLORS
 from src.item import Item
 from src.powerup import Powerup, PowerupType, ActiveEffect, POWERUP_CONFIG
 from src.sound import _tone, _concat, _mix, _silence, SoundManager
+from src.sprites import circle_surface
 from src.game import KONAMI_CODE, Game
 
 
@@ -52,7 +55,16 @@ class TestPlayer:
         p = Player(100, 100)
         p.move(1, 0, 800, 600)
         p.move(1, 0, 800, 600)
-        assert len(p.path_history) == 2
+        assert len(p.path_x) == 2
+        assert len(p.path_y) == 2
+
+    def test_trail_is_bounded(self):
+        """Player trail should keep only the most recent positions."""
+        p = Player(100, 100)
+        for _ in range(Player.TRAIL_LENGTH + 5):
+            p.move(1, 0, 800, 600)
+        assert len(p.trail) == Player.TRAIL_LENGTH
+        assert p.trail[-1] == (p.x, p.y)
 
     def test_boundary_left(self):
         """Player should not go past left boundary."""
@@ -86,7 +98,20 @@ class TestPlayer:
         p.reset(400, 300)
         assert p.x == 400
         assert p.y == 300
-        assert len(p.path_history) == 0
+        assert len(p.path_x) == 0
+
+    def test_snapshot_survives_further_movement(self):
+        """Echo built from a snapshot should replay only frames recorded so far."""
+        p = Player(100, 100)
+        p.move(1, 0, 800, 600)
+        p.move(1, 0, 800, 600)
+        e = Echo.from_history(*p.snapshot(), 0)
+        p.move(1, 0, 800, 600)
+        for _ in range(5):
+            e.update()
+        assert e.finished is True
+        assert e.frame_index == 2
+        assert e.x == p.path_x[1]
 
     def test_diagonal_normalization(self):
         """Diagonal movement should be normalized."""
@@ -129,6 +154,39 @@ class TestEcho:
         e.update()  # frame 1 -> 2
         e.update()  # frame 2 >= len(path), finished
         assert e.finished is True
+        assert (e.x, e.y) == (60.0, 50.0)  # Holds last position
+
+    def test_trail_is_bounded(self):
+        """Echo trail should keep only the most recent positions."""
+        path = [(float(i), 0.0) for i in range(Echo.TRAIL_LENGTH + 10)]
+        e = Echo(path, 0)
+        for _ in range(len(path)):
+            e.update()
+        assert len(e.trail) == Echo.TRAIL_LENGTH
+        assert e.trail[-1] == len(path) - 1
+
+    def test_color_change_rerenders_sprites(self):
+        """Changing echo color should swap in sprites of the new color."""
+        e = Echo([(0, 0)], 0)
+        old_sprite = e._main_surf
+        e.color = (10, 20, 30)
+        assert e._main_surf is not old_sprite
+        assert e._main_surf is circle_surface((10, 20, 30, 160), Echo.RADIUS)
+
+    def test_draw_items_ends_with_body(self):
+        """Echo blit list should cover the trail, glow and body in order."""
+        path = [(50.0, 60.0), (52.0, 60.0), (54.0, 60.0)]
+        e = Echo(path, 0)
+        e.update()
+        e.update()
+        items = e.draw_items()
+        assert len(items) == len(e.trail) + 2
+        assert items[-1] == (e._main_surf, (54 - Echo.RADIUS, 60 - Echo.RADIUS))
+
+    def test_uses_slots(self):
+        """Echo instances should not carry a per-instance __dict__."""
+        e = Echo([(0, 0)], 0)
+        assert not hasattr(e, "__dict__")
 
     def test_color_cycling(self):
         """Each echo should get a different color."""
@@ -137,11 +195,27 @@ class TestEcho:
         assert e1.color != e2.color
 
     def test_path_is_copied(self):
-        """Echo should copy the path, not reference it."""
-        path = [(50.0, 50.0)]
+        """Echo should copy the path into its own coordinate arrays."""
+        path = [(50.0, 60.0)]
         e = Echo(path, 0)
         path.append((100.0, 100.0))
-        assert len(e.path) == 1
+        assert list(e.path_x) == [50.0]
+        assert list(e.path_y) == [60.0]
+
+
+class TestSprites:
+    """Tests for the shared sprite cache."""
+
+    def test_circle_surface_is_cached(self):
+        """Circle surfaces should be reused for identical parameters."""
+        s1 = circle_surface((255, 0, 0, 40), 5)
+        s2 = circle_surface((255, 0, 0, 40), 5)
+        assert s1 is s2
+        assert s1.get_size() == (10, 10)
+
+    def test_circle_surface_differs_by_color(self):
+        """Different colors should get different surfaces."""
+        assert circle_surface((255, 0, 0, 40), 5) is not circle_surface((0, 255, 0, 40), 5)
 
 
 class TestItem:
@@ -178,6 +252,13 @@ class TestItem:
         item.y = 100
         assert item.collides_with(400, 400, 12) is False
 
+    def test_no_collision_when_just_touching(self):
+        """Circles whose edges exactly touch should not collide."""
+        item = Item(800, 600)
+        item.x = 100
+        item.y = 100
+        assert item.collides_with(100 + Item.RADIUS + 12, 100, 12) is False
+
 
 class TestPowerup:
     """Tests for Powerup class."""
@@ -221,11 +302,19 @@ class TestPowerup:
         p = Powerup(800, 600)
         assert p.collides_with(p.x, p.y, 12) is False
 
+    def test_collision_when_active(self):
+        """Active powerup should collide with an overlapping circle only."""
+        p = Powerup(800, 600)
+        for _ in range(100):
+            p.update(0.1)
+        assert p.collides_with(p.x + 5, p.y, 12) is True
+        assert p.collides_with(p.x + 20, p.y + 20, 12) is False
+
     def test_ghost_eater_is_rarer(self):
         """Ghost eater should have lower spawn weight."""
-        ge_weight = POWERUP_CONFIG[PowerupType.GHOST_EATER]["spawn_weight"]
-        tf_weight = POWERUP_CONFIG[PowerupType.TIME_FREEZE]["spawn_weight"]
-        sh_weight = POWERUP_CONFIG[PowerupType.SHRINK]["spawn_weight"]
+        ge_weight = POWERUP_CONFIG[PowerupType.GHOST_EATER].spawn_weight
+        tf_weight = POWERUP_CONFIG[PowerupType.TIME_FREEZE].spawn_weight
+        sh_weight = POWERUP_CONFIG[PowerupType.SHRINK].spawn_weight
         assert ge_weight < tf_weight
         assert ge_weight < sh_weight
 
@@ -241,7 +330,7 @@ class TestActiveEffect:
     def test_effect_expires(self):
         """Effect should expire after duration."""
         e = ActiveEffect(PowerupType.TIME_FREEZE)
-        duration = POWERUP_CONFIG[PowerupType.TIME_FREEZE]["duration"]
+        duration = POWERUP_CONFIG[PowerupType.TIME_FREEZE].duration
         result = e.update(duration + 1)
         assert result is False
 
@@ -297,6 +386,13 @@ class TestSound:
         result = _mix(short, long)
         assert len(result) == len(long)
 
+    def test_mix_averages_overlap_and_keeps_tail(self):
+        """Mix should average where buffers overlap and pass the tail through."""
+        a = struct.pack('<3h', 100, -200, 7)
+        b = struct.pack('<h', 300)
+        result = struct.unpack('<3h', _mix(a, b))
+        assert result == (200, -200, 7)
+
     def test_different_waves(self):
         """Different wave types should produce different data."""
         sine = _tone(440, 0.05, wave="sine")
@@ -334,6 +430,16 @@ class TestKonamiCode:
         c2 = Game._disco_color(1.0)
         assert c1 != c2
 
+    def test_disco_color_cycles(self):
+        """Disco color should repeat after one full cycle."""
+        period = 2 * math.pi / 3.0
+        assert Game._disco_color(0.25) == Game._disco_color(0.25 + period * 4)
+
+    def test_disco_color_steps(self):
+        """Quantized disco colors should come from a limited palette."""
+        colors = {Game._disco_color(t / 100, steps=8) for t in range(500)}
+        assert len(colors) <= 8
+
     def test_konami_buffer_tracks_keys(self):
         """Konami buffer should accumulate key presses."""
         import pygame
@@ -346,10 +452,8 @@ class TestKonamiCode:
 
     def test_konami_buffer_max_length(self):
         """Buffer should not exceed Konami code length."""
-        buf = []
+        buf = deque(maxlen=len(KONAMI_CODE))
         for key in [999] * 20 + list(KONAMI_CODE):
             buf.append(key)
-            if len(buf) > len(KONAMI_CODE):
-                buf.pop(0)
         assert len(buf) == len(KONAMI_CODE)
-        assert buf == KONAMI_CODE
+        assert tuple(buf) == tuple(KONAMI_CODE)